@@ -1,7 +1,7 @@
 import random
 from functools import partial
 
-from match_variant._maybe import Maybe
+from match_variant import Maybe
 
 
 def get_a_maybe():
@@ -6,3 +6,4 @@ from ._result import Result as Result
 from ._result import Trapped as Trapped
 from ._result import trap as trap
 from ._variant import Variant as Variant
+from ._variant import VariantArray as VariantArray
@@ -1,18 +1,19 @@
 import inspect
-from functools import lru_cache
 from typing import Any
 
 from ._maybe import Maybe
 from ._variant import Variant
 
+_NOTHING = Maybe.nothing()
+
 
 class Enum(Variant):
     """Variants can model simple enums.
 
     The Variant class stores any default value assigned to a
-    field in the special __value__ field. This class has an
-    lru_cached `from_value` class function to look up the field
-    given a value.
+    field in the special __value__ field. This class has a
+    `from_value` class function to look up the field given a
+    value, using a table built when the class is defined.
 
     Example:
 
@@ -29,25 +30,50 @@ class Enum(Variant):
             print("Unexpected status")
     """
 
+    __value_map__ = {}
+    __unhashable_values__ = ()
+
+    def __init_subclass__(cls) -> None:
+        """Build a lookup table from each field's value to its from_value result.
+
+        Values inherited from a parent Enum are kept. Unhashable values can't
+        go in the table, so they are kept in a list and scanned instead.
+        """
+        super().__init_subclass__()
+        annotations = inspect.get_annotations(cls)
+        if annotations:
+            value_map = dict(cls.__value_map__)
+            unhashable_values = list(cls.__unhashable_values__)
+            for field_name in annotations:
+                field = getattr(cls, field_name)
+                if hasattr(field, "__value__") and not field.__match_args__:
+                    result = Maybe.just(field())
+                    try:
+                        value_map.setdefault(field.__value__, result)
+                    except TypeError:
+                        unhashable_values.append((field.__value__, result))
+            cls.__value_map__ = value_map
+            cls.__unhashable_values__ = tuple(unhashable_values)
+
     @classmethod
-    @lru_cache
     def from_value(cls, value: Any) -> Maybe:
         """
         Given a value, return the variant associated with
         that field.
 
         Returns a Maybe that is set to Maybe.nothing if the
-        field is not set.
+        field is not set. Only variants that hold no data can be
+        looked up by value.
         """
-        last_class = None
-        for parent_class in cls.__mro__:
-            if parent_class == Enum:
-                break
-            last_class = parent_class
-
-        for field_name in inspect.get_annotations(last_class):
-            field = getattr(last_class, field_name)
-            if hasattr(field, "__value__") and field.__value__ == value:
-                return Maybe.just(field())
-
-        return Maybe.nothing()
+        try:
+            result = cls.__value_map__.get(value)
+        except TypeError:
+            result = None
+        if result is not None:
+            return result
+
+        for field_value, result in cls.__unhashable_values__:
+            if field_value == value:
+                return result
+
+        return _NOTHING
@@ -1,7 +1,7 @@
 # type: ignore
 from __future__ import annotations
 
-from typing import Callable, Generic, TypeVar, final
+from typing import Any, Callable, Generic, TypeVar, final
 
 from ._variant import Variant
 
@@ -32,7 +32,7 @@ class Maybe(Generic[T], Variant):
 
         Example:
 
-        >>> from basicenum.maybe import Maybe
+        >>> from match_variant import Maybe
         >>> Maybe.just("hello").apply(str.upper)
         <Maybe.just: 'HELLO'>
         >>>
@@ -40,11 +40,32 @@ class Maybe(Generic[T], Variant):
         <Maybe.nothing>
         >>>
         """
-        match self:
-            case Maybe.just(val):
-                return Maybe.just(func(val))
-            case Maybe.nothing():
-                return self
+        if type(self) is Maybe.just:
+            return Maybe.just(func(self._0))
+        return self
+
+    def apply_many(self, *funcs: Callable[[Any], Any]) -> Maybe[Any]:
+        """Apply several functions to the contained value, in order.
+
+        Equivalent to chaining `apply` calls, but the value is only unwrapped
+        and rewrapped once, no matter how many functions are given.
+
+        Example:
+
+        >>> from match_variant import Maybe
+        >>> Maybe.just("hello").apply_many(str.upper, len)
+        Maybe.just(5)
+        >>>
+        >>> Maybe.nothing().apply_many(str.upper, len)
+        Maybe.nothing()
+        >>>
+        """
+        if type(self) is not Maybe.just:
+            return self
+        value = self._0
+        for func in funcs:
+            value = func(value)
+        return Maybe.just(value)
 
     def filter(self, func: Callable[[T], bool]) -> Maybe[T]:
         """Filter the contained value.
@@ -54,7 +75,7 @@ class Maybe(Generic[T], Variant):
 
         Example:
 
-        >>> from basicenum.maybe import Maybe
+        >>> from match_variant import Maybe
         >>> Maybe.just("hello").filter(lambda x: len(x) > 3)
         <Maybe.just: 'hello'>
         >>>
@@ -64,13 +85,9 @@ class Maybe(Generic[T], Variant):
         >>> Maybe.nothing().filter(lambda x: len(x) > 3)
         <Maybe.nothing>
         """
-        match self:
-            case Maybe.just(val):
-                if func(val):
-                    return self
-                return Maybe.nothing()
-            case Maybe.nothing():
-                return self
+        if type(self) is Maybe.just and not func(self._0):
+            return Maybe.nothing()
+        return self
 
     def unwrap(self, *, default: T = _RAISE) -> T:
         """
@@ -83,7 +100,7 @@ class Maybe(Generic[T], Variant):
 
         Example:
 
-        >>> from basicenum.maybe import Maybe
+        >>> from match_variant import Maybe
         >>> Maybe.just("hello").unwrap()
         'hello'
         >>> Maybe.nothing().unwrap(default="default")
@@ -96,15 +113,18 @@ class Maybe(Generic[T], Variant):
         TypeError: Attempted to unwrap Maybe.nothing(); can only unwrap Maybe.just(val)
         >>>
         """
-        match self:
-            case Maybe.just(val):
-                return val
-            case Maybe.nothing():
-                if default is _RAISE:
-                    raise TypeError(
-                        "Attempted to unwrap Maybe.nothing(); can only unwrap Maybe.just(val)"
-                    )
-                return default
+        if type(self) is Maybe.just:
+            return self._0
+        return self._raise_or_default(default)
+
+    @staticmethod
+    def _raise_or_default(default: T) -> T:
+        """Handle unwrapping Maybe.nothing, kept out of unwrap's fast path."""
+        if default is _RAISE:
+            raise TypeError(
+                "Attempted to unwrap Maybe.nothing(); can only unwrap Maybe.just(val)"
+            )
+        return default
 
     def __iter__(self) -> None:
         """Iterate over the Maybe.
@@ -115,15 +135,12 @@ class Maybe(Generic[T], Variant):
 
         Example:
 
-        >>> from basicenum.maybe import Maybe
+        >>> from match_variant import Maybe
         >>> for val in Maybe.just("hello"): print(val)
         hello
         >>> for val in Maybe.nothing(): print(val)
         >>>
         """
-        match self:
-            case Maybe.just(val):
-                yield val
-            case Maybe.nothing():
-                pass
+        if type(self) is Maybe.just:
+            yield self._0
 
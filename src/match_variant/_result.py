@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Callable, Generic, TypeVar, Union, final
+from typing import Any, Callable, Generic, TypeVar, Union, final
 
 from ._maybe import Maybe
-from ._variant import Variant
+from ._variant import Variant, _install_methods
 
 T = TypeVar("T")
 E = TypeVar("E", bound=BaseException)
@@ -30,9 +29,11 @@ class Result(Generic[T, E], Variant):
         applied to the value inside the `Result.ok`. Otherwise, return `Result.error`
         unchanged.
 
+        This method implements the `Result.ok` side; `Result.error` overrides it.
+
         Example:
 
-        >>> from basicenum.result import Result
+        >>> from match_variant import Result
         >>> Result.ok("hello").apply(str.upper)
         <Result.ok: 'HELLO'>
         >>>
@@ -40,11 +41,30 @@ class Result(Generic[T, E], Variant):
         <Result.error: ValueError('oops')>
         >>>
         """
-        match self:
-            case Result.ok(val):
-                return Result.ok(func(val))
-            case Result.error(_):
-                return self
+        return Result.ok(func(self._0))
+
+    def apply_many(self, *funcs: Callable[[Any], Any]) -> Result[Any, E]:
+        """Apply several functions to the contained value, in order.
+
+        Equivalent to chaining `apply` calls, but the value is only unwrapped
+        and rewrapped once, no matter how many functions are given.
+
+        This method implements the `Result.ok` side; `Result.error` overrides it.
+
+        Example:
+
+        >>> from match_variant import Result
+        >>> Result.ok("hello").apply_many(str.upper, len)
+        Result.ok(5)
+        >>>
+        >>> Result.error(ValueError("oops")).apply_many(str.upper, len)
+        Result.error(ValueError('oops'))
+        >>>
+        """
+        value = self._0
+        for func in funcs:
+            value = func(value)
+        return Result.ok(value)
 
     def unwrap(self) -> T:
         """
@@ -54,9 +74,11 @@ class Result(Generic[T, E], Variant):
 
         If it is Result.error, raise the error.
 
+        This method implements the `Result.ok` side; `Result.error` overrides it.
+
         Example:
 
-        >>> from basicenum.result import Result
+        >>> from match_variant import Result
         >>> Result.ok("hello").unwrap()
         'hello'
         >>> Result.error(ValueError("oops")).unwrap()
@@ -66,19 +88,49 @@ class Result(Generic[T, E], Variant):
             raise ex
         ValueError: oops
         """
-        match self:
-            case Result.ok(val):
-                return val
-            case Result.error(ex):
-                raise ex
+        return self._0
 
     def to_maybe(self) -> Maybe[T]:
-        """Convert the result to an option, discarding the error if any"""
-        match self:
-            case Result.ok(value):
-                return Maybe.just(value)
-            case Result.error(_):
-                return Maybe.nothing()
+        """Convert the result to an option, discarding the error if any.
+
+        This method implements the `Result.ok` side; `Result.error` overrides it.
+        """
+        return Maybe.just(self._0)
+
+
+def _error_apply(self: Result[T, E], func: Callable[[T], U]) -> Result[U, E]:
+    """Return this `Result.error` unchanged; `func` is not called."""
+    return self
+
+
+def _error_apply_many(
+    self: Result[T, E], *funcs: Callable[[Any], Any]
+) -> Result[Any, E]:
+    """Return this `Result.error` unchanged; none of `funcs` are called."""
+    return self
+
+
+def _error_unwrap(self: Result[T, E]) -> T:
+    """Raise the exception held by this `Result.error`."""
+    raise self._0
+
+
+def _error_to_maybe(self: Result[T, E]) -> Maybe[T]:
+    """Return `Maybe.nothing`, discarding the error."""
+    return Maybe.nothing()
+
+
+# Result.ok inherits the methods defined on Result; Result.error overrides
+# them, so dispatching on the variant is an ordinary method lookup.
+_install_methods(
+    Result.error,
+    {
+        "apply": _error_apply,
+        "apply_many": _error_apply_many,
+        "unwrap": _error_unwrap,
+        "to_maybe": _error_to_maybe,
+    },
+)
 
 
 class Trapped(Generic[T, E]):
@@ -87,7 +139,12 @@ class Trapped(Generic[T, E]):
     See `trap`.
     """
 
-    value: Union[Result[T, E], None] = None
+    __slots__ = ("value",)
+
+    value: Union[Result[T, E], None]
+
+    def __init__(self) -> None:
+        self.value = None
 
     def ok(self, value: T):
         """Set the trapped result to an ok value."""
@@ -114,12 +171,11 @@ class Trapped(Generic[T, E]):
         return self.value
 
 
-@contextmanager
-def trap(*exceptions):
+class trap:
     """
     Run a section of code and convert it to a Result type.
 
-    Yields a Trapped object. Typical usage as follows:
+    Entering the context returns a Trapped object. Typical usage as follows:
 
     d = {"key": "value"}
     with trap(KeyError) as trapped:
@@ -133,11 +189,18 @@ def trap(*exceptions):
         case _ as x:
             Result.exhaust(x)
     """
-    if not (exceptions):
-        exceptions = (Exception,)
-
-    trapped = Trapped()
-    try:
-        yield trapped
-    except exceptions as ex:
-        trapped.error(ex)
+
+    __slots__ = ("_exceptions", "_trapped")
+
+    def __init__(self, *exceptions: type[BaseException]) -> None:
+        self._exceptions = exceptions or (Exception,)
+
+    def __enter__(self) -> Trapped:
+        self._trapped = Trapped()
+        return self._trapped
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is not None and issubclass(exc_type, self._exceptions):
+            self._trapped.error(exc_value)
+            return True
+        return False
@@ -1,59 +1,181 @@
+import ast
 import inspect
-import types
-from contextlib import suppress
-from typing import Any, NoReturn, Type
+from array import array
+from typing import Any, Iterator, NoReturn, Type, Union
+
+
+# Shared __match_args__ for the common arities, so variants of the same
+# arity reuse one tuple instead of formatting field names for each.
+_MATCH_ARGS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(f"_{index}" for index in range(arity)) for arity in range(8)
+)
 
 
 class VariantMeta(type):
-    """Placeholder for when we add metaclass features"""
+    """Give every class in a Variant hierarchy empty __slots__ by default.
+
+    Without this, any intermediate class (such as `Maybe`) that doesn't declare
+    __slots__ would reintroduce a per-instance __dict__.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+def _new_singleton(cls, *args):
+    """Return the one shared instance of a variant that holds no data."""
+    instance = cls.__dict__.get("__singleton__")
+    if instance is None:
+        instance = object.__new__(cls)
+        cls.__singleton__ = instance
+    return instance
+
+
+def _specialize(qualname: str, arity: int) -> dict[str, Any]:
+    """Build an __init__ unrolled for `arity` fields.
+
+    The arguments are kept as one tuple for comparing and hashing, and each
+    field is also stored in its own slot so that reading it (including
+    destructuring in a match statement) is a plain slot load.
+    """
+    fields = [f"self._{index}" for index in range(arity)]
+    source = (
+        "def __init__(self, *args):\n"
+        f"    if len(args) != {arity}:\n"
+        "        raise TypeError(\n"
+        f"            f'{{type(self).__qualname__}}() takes exactly {arity} arguments ({{len(args)}} given)'\n"
+        "        )\n"
+        "    self.__variant_args__ = args\n"
+        + (f"    {', '.join(fields)}, = args\n" if fields else "")
+    )
+    methods: dict[str, Any] = {}
+    exec(compile(source, f"<{qualname}>", "exec"), {}, methods)
+    for name, method in methods.items():
+        method.__doc__ = getattr(Variant, name).__doc__
+    return methods
+
+
+def _install_methods(variant: type, methods: dict[str, Any]) -> None:
+    """Attach methods to a generated variant class, named as if defined on it.
 
-    pass
+    The names are also set on the code objects so that tracebacks show the
+    method name.
+    """
+    for name, method in methods.items():
+        method.__name__ = name
+        method.__qualname__ = f"{variant.__qualname__}.{name}"
+        method.__code__ = method.__code__.replace(co_name=name)
+        setattr(variant, name, method)
+
+
+def _slot_names(cls: type) -> list[str]:
+    """List the (mangled) names of every slot declared in the class's MRO."""
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            names.append(name)
+    return names
+
+
+def _arity(cls: type, name: str, annotation: Any) -> int:
+    """Count the fields declared by a variant's annotation.
+
+    Only the shape of the annotation matters, so tuple literals are measured
+    without being evaluated. Anything else (e.g. an alias for a tuple) falls
+    back to evaluating the annotations.
+    """
+    if isinstance(annotation, tuple):
+        return len(annotation)
+    if isinstance(annotation, str):
+        node = ast.parse(annotation, mode="eval").body
+        if isinstance(node, ast.Tuple):
+            return len(node.elts)
+    return len(inspect.get_annotations(cls, eval_str=True)[name])
 
 
 class Variant(metaclass=VariantMeta):
+    __slots__ = ("__variant_args__", "__variant_hash__", "__weakref__")
+
     def __init_subclass__(cls) -> None:
         """Replace all fields with variants based on the field type annotations"""
-        annotations = inspect.get_annotations(cls, eval_str=True)
+        namespace = cls.__dict__
+        annotations = inspect.get_annotations(cls)
         for name, annotation in annotations.items():
-            nc: Type[cls] = types.new_class(name, bases=(cls,))
-
-            nc.__qualname__ = f"{cls.__qualname__}.{name}"
-            nc.__match_args__: tuple[str, ...] = tuple(
-                (f"_{index}" for index in range(len(annotation)))
-            )
-            with suppress(AttributeError):
-                nc.__value__ = getattr(cls, name)
+            arity = _arity(cls, name, annotation)
+            if arity < len(_MATCH_ARGS):
+                match_args = _MATCH_ARGS[arity]
+            else:
+                match_args = tuple(f"_{index}" for index in range(arity))
+            qualname = f"{cls.__qualname__}.{name}"
+            variant_namespace: dict[str, Any] = {
+                "__module__": cls.__module__,
+                "__qualname__": qualname,
+                "__match_args__": match_args,
+                "__slots__": match_args,
+            }
+            if not match_args:
+                variant_namespace["__new__"] = _new_singleton
+            if name in namespace:
+                variant_namespace["__value__"] = namespace[name]
+            nc: Type[cls] = type(cls)(name, (cls,), variant_namespace)
+            _install_methods(nc, _specialize(qualname, arity))
             setattr(cls, name, nc)
 
     def __init__(self, *args: Any) -> None:
         """Construct a Variant, ensuring the correct number of args are supplied"""
-        if len(args) != len(self.__match_args__):
+        match_args = self.__match_args__
+        if len(args) != len(match_args):
             raise TypeError(
-                f"{type(self).__qualname__}() takes exactly {len(self.__match_args__)} arguments ({len(args)} given)"
+                f"{type(self).__qualname__}() takes exactly {len(match_args)} arguments ({len(args)} given)"
             )
 
-        for index, arg in enumerate(args):
-            setattr(self, f"_{index}", arg)
+        self.__variant_args__ = args
+        for name, arg in zip(match_args, args):
+            setattr(self, name, arg)
 
     def __repr__(self):
         """Print a representation of the arguments for the subtype"""
-        params = ", ".join(repr(getattr(self, arg)) for arg in self.__match_args__)
+        params = ", ".join(map(repr, self.__variant_args__))
         return f"{type(self).__qualname__}({params})"
 
     def __eq__(self, other):
         """If the instances are the same variant, check they have the same arguments."""
+        if self is other:
+            return True
 
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return NotImplemented
 
-        return all(
-            getattr(self, arg) == getattr(other, arg) for arg in self.__match_args__
-        )
+        return self.__variant_args__ == other.__variant_args__
 
     def __hash__(self):
-        """ADT is expected to be immutable, so it can hash."""
+        """ADT is expected to be immutable, so it can hash, and cache the hash."""
+        try:
+            return self.__variant_hash__
+        except AttributeError:
+            self.__variant_hash__ = hash(self.__variant_args__)
+            return self.__variant_hash__
+
+    def __getstate__(self):
+        """Save every slot for copy and pickle except the cached hash.
 
-        return hash(tuple(getattr(self, arg) for arg in self.__match_args__))
+        String hashes differ between processes, so a stored hash would be
+        wrong after unpickling elsewhere.
+        """
+        state = {}
+        for name in _slot_names(type(self)):
+            if name not in ("__variant_hash__", "__weakref__"):
+                try:
+                    state[name] = getattr(self, name)
+                except AttributeError:
+                    pass
+        return None, state
 
     @classmethod
     def exhaust(cls, value: NoReturn) -> NoReturn:
@@ -73,3 +195,90 @@ class Variant(metaclass=VariantMeta):
                 Maybe.exhaust(x)
         """
         raise ValueError(f"Unsupported match arm: {value}")
+
+
+class VariantArray:
+    """Compactly store many instances of one Variant class.
+
+    Rather than keeping a list of Variant objects, each entry is stored as a
+    one-byte tag identifying its variant plus the tuple of its arguments.
+    Variants are rebuilt on access. Scanning for all entries of one variant
+    is a search over the tag bytes instead of an isinstance call per entry.
+
+    Example:
+
+    users = VariantArray(Role)
+    users.append(Role.anonymous())
+    users.append(Role.admin("morgan", {"can_edit": True}))
+
+    for index in users.filter_case("admin"):
+        print(users[index])
+    """
+
+    __slots__ = ("_variant_cls", "_names", "_cases", "_tags", "_payloads")
+
+    def __init__(self, variant_cls: Type[Variant]) -> None:
+        self._variant_cls = variant_cls
+        # Include variants inherited from parent Variant classes, parents first.
+        names = {}
+        for klass in reversed(variant_cls.__mro__):
+            if issubclass(klass, Variant) and klass is not Variant:
+                names.update(dict.fromkeys(inspect.get_annotations(klass)))
+        self._names: tuple[str, ...] = tuple(names)
+        self._cases: tuple[type, ...] = tuple(
+            getattr(variant_cls, name) for name in self._names
+        )
+        if not self._cases or len(self._cases) > 256:
+            raise TypeError(
+                f"{variant_cls.__qualname__} must declare between 1 and 256 variants"
+            )
+        self._tags = array("B")
+        self._payloads: list[tuple[Any, ...]] = []
+
+    def append(self, variant: Variant) -> None:
+        """Add a variant to the end of the array."""
+        try:
+            tag = self._cases.index(type(variant))
+        except ValueError:
+            raise TypeError(
+                f"{variant!r} is not a variant of {self._variant_cls.__qualname__}"
+            ) from None
+        self._tags.append(tag)
+        self._payloads.append(variant.__variant_args__)
+
+    def filter_case(self, name: str) -> list[int]:
+        """Return the indexes of every entry that is the named variant.
+
+        Raises ValueError if `name` is not a variant declared on the class.
+        """
+        if name not in self._names:
+            raise ValueError(
+                f"{name!r} is not a variant of {self._variant_cls.__qualname__}"
+            )
+        tag = bytes((self._names.index(name),))
+        tags = self._tags.tobytes()
+        indexes = []
+        index = tags.find(tag)
+        while index != -1:
+            indexes.append(index)
+            index = tags.find(tag, index + 1)
+        return indexes
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Variant, "VariantArray"]:
+        """Rebuild the variant at `index`, or a new VariantArray for a slice."""
+        if isinstance(index, slice):
+            sliced = VariantArray(self._variant_cls)
+            sliced._tags = self._tags[index]
+            sliced._payloads = self._payloads[index]
+            return sliced
+        return self._cases[self._tags[index]](*self._payloads[index])
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __iter__(self) -> Iterator[Variant]:
+        cases = self._cases
+        for tag, payload in zip(self._tags, self._payloads):
+            yield cases[tag](*payload)
@@ -5,6 +5,7 @@ class MyEnum(Enum):
     a: () = 1  # type: ignore
     b: () = 2  # type: ignore
     c: (int,)  # type: ignore
+    d: (int,) = 4  # type: ignore
 
 
 def test_from_value_exists():
@@ -13,3 +14,45 @@ def test_from_value_exists():
 
 def test_from_value_no_exist():
     assert isinstance(MyEnum.from_value(99), Maybe.nothing)
+
+
+def test_from_value_on_variant():
+    assert MyEnum.b.from_value(1).unwrap() == MyEnum.a()
+
+
+def test_from_value_is_singleton():
+    assert MyEnum.from_value(2).unwrap() is MyEnum.b()
+
+
+def test_from_value_with_data_no_exist():
+    assert isinstance(MyEnum.from_value(4), Maybe.nothing)
+
+
+def test_from_value_int_and_str_keys():
+    class Mixed(Enum):
+        one: () = 1  # type: ignore
+        two: () = "two"  # type: ignore
+
+    assert Mixed.from_value(1).unwrap() is Mixed.one()
+    assert Mixed.from_value("two").unwrap() is Mixed.two()
+    assert Mixed.from_value(1.0).unwrap() is Mixed.one()
+    assert isinstance(Mixed.from_value("one"), Maybe.nothing)
+
+
+def test_from_value_unhashable_value():
+    class Unhashable(Enum):
+        listed: () = [1]  # type: ignore
+        plain: () = 2  # type: ignore
+
+    assert Unhashable.from_value([1]).unwrap() is Unhashable.listed()
+    assert Unhashable.from_value(2).unwrap() is Unhashable.plain()
+    assert isinstance(Unhashable.from_value([2]), Maybe.nothing)
+
+
+def test_from_value_inherited_values():
+    class Child(MyEnum):
+        e: () = 5  # type: ignore
+
+    assert Child.from_value(1).unwrap() is MyEnum.a()
+    assert Child.from_value(5).unwrap() is Child.e()
+    assert isinstance(MyEnum.from_value(5), Maybe.nothing)
@@ -18,6 +18,23 @@ def test_apply_just():
     assert maybe.apply(str.upper).unwrap() == val.upper()
 
 
+def test_apply_many_nothing():
+    maybe = Maybe.nothing()
+
+    def no_call_me(x):
+        pytest.fail("I should not be called")
+
+    assert maybe.apply_many(no_call_me, no_call_me) is maybe
+
+
+def test_apply_many_just():
+    assert Maybe.just("hello").apply_many(str.upper, len) == Maybe.just(5)
+
+
+def test_apply_many_no_funcs():
+    assert Maybe.just("hello").apply_many() == Maybe.just("hello")
+
+
 def test_just_unwrap():
     val = "I am a value"
     j = Maybe.just(val)
@@ -34,3 +51,29 @@ def test_nothing_unwrap_raises():
 def test_nothing_unwrap_default():
     expected = "YAY"
     assert Maybe.nothing().unwrap(default=expected) is expected
+
+
+def test_filter_just_passes():
+    maybe = Maybe.just("hello")
+    assert maybe.filter(lambda x: len(x) > 3) is maybe
+
+
+def test_filter_just_fails():
+    assert Maybe.just("abc").filter(lambda x: len(x) > 3) == Maybe.nothing()
+
+
+def test_filter_nothing():
+    def no_call_me(x):
+        pytest.fail("I should not be called")
+
+    assert Maybe.nothing().filter(no_call_me) == Maybe.nothing()
+
+
+def test_iter():
+    assert list(Maybe.just("hello")) == ["hello"]
+    assert list(Maybe.nothing()) == []
+
+
+def test_just_unwrap_ignores_default():
+    val = "I am a value"
+    assert Maybe.just(val).unwrap(default="unused") is val
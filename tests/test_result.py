@@ -1,6 +1,6 @@
 import pytest
 
-from match_variant import Result, Trapped, trap
+from match_variant import Maybe, Result, Trapped, trap
 
 
 def test_apply_error():
@@ -18,6 +18,19 @@ def test_apply_ok():
     assert result.apply(str.upper).unwrap() == val.upper()
 
 
+def test_apply_many_error():
+    result = Result.error(ValueError("nope"))
+
+    def no_call_me(x):
+        pytest.fail("I should not be called")
+
+    assert result.apply_many(no_call_me, no_call_me) is result
+
+
+def test_apply_many_ok():
+    assert Result.ok("hello").apply_many(str.upper, len) == Result.ok(5)
+
+
 def test_unwrap_ok():
     val = "I am a value"
     result = Result.ok(val)
@@ -82,3 +95,41 @@ def test_trap_no_ok_call():
         result.result.unwrap()
 
     assert "never" in str(ex.value)
+
+
+def test_to_maybe():
+    assert Result.ok("value").to_maybe() == Maybe.just("value")
+    assert Result.error(ValueError("nope")).to_maybe() == Maybe.nothing()
+
+
+def test_trap_returns_fresh_trapped():
+    with trap() as first:
+        first.ok("first")
+
+    with trap() as second:
+        second.ok("second")
+
+    assert first is not second
+    assert first.result == Result.ok("first")
+
+
+def test_trap_other_exception_propagates():
+    with pytest.raises(KeyError):
+        with trap(ValueError):
+            raise KeyError("nope")
+
+
+def test_trap_defaults_to_exception():
+    value = KeyError("Nope")
+    with trap() as result:
+        raise value
+
+    assert result.result == Result.error(value)
+
+
+def test_error_methods_are_documented():
+    error = Result.error(ValueError("nope"))
+    for name in ("apply", "apply_many", "unwrap", "to_maybe"):
+        method = getattr(error, name)
+        assert method.__qualname__ == f"Result.error.{name}"
+        assert method.__doc__
@@ -1,6 +1,16 @@
+import copy
+import pickle
+import weakref
+
 import pytest
 
-from match_variant import Variant
+from match_variant import Variant, VariantArray
+
+
+class NotedVariant(Variant):
+    __slots__ = ("note", "__private")
+
+    plain: (int,)  # type: ignore
 
 
 class TestVariant(Variant):
@@ -96,12 +106,35 @@ def test_repr():
         pytest.param(
             TestVariant.option_list([]), "a string", False, id="different type"
         ),
+        pytest.param(
+            TestVariant.option1("one"),
+            TestVariant.option_list("one"),
+            False,
+            id="same value different variant",
+        ),
+        pytest.param(
+            TestVariant.option2("one", 2),
+            TestVariant.option2("one", 3),
+            False,
+            id="equal first value, unequal second value",
+        ),
     ],
 )
 def test_is_eq(self, other, expected):
     assert (self == other) is expected
 
 
+def test_eq_returns_bool():
+    class TupleEq:
+        def __eq__(self, other):
+            return ("EQ", 1, 2)
+
+    assert (TestVariant.option1(TupleEq()) == TestVariant.option1(TupleEq())) is True
+    assert (
+        TestVariant.option2(TupleEq(), 1) == TestVariant.option2(TupleEq(), 1)
+    ) is True
+
+
 def test_hash_identical_val_hashable():
     val = "something"
     assert hash(TestVariant.option1(val)) == hash(TestVariant.option1(val))
@@ -173,3 +206,227 @@ def test_exhaust():
     ex_str = str(ex.value)
     assert "TestVariant.option1" in ex_str
     assert "Value" in ex_str
+
+
+def test_instances_have_no_dict():
+    with pytest.raises(AttributeError):
+        TestVariant.option1("one").__dict__
+
+    with pytest.raises(AttributeError):
+        TestVariant.option2("one", 2).unknown = "value"
+
+
+def test_weakref():
+    variant = TestVariant.option1("one")
+    assert weakref.ref(variant)() is variant
+
+
+def test_no_args_is_singleton():
+    assert TestVariant.option0() is TestVariant.option0()
+    assert TestVariant.option1("one") is not TestVariant.option1("one")
+
+
+def test_no_args_singleton_checks_args():
+    with pytest.raises(TypeError):
+        TestVariant.option0("unexpected")
+
+
+def test_string_annotations():
+    class StringVariant(Variant):
+        option0: "()"  # type: ignore
+        option2: "(str, int)"  # type: ignore
+
+    assert StringVariant.option0.__match_args__ == ()
+    assert StringVariant.option2.__match_args__ == ("_0", "_1")
+
+
+def test_fields_by_position():
+    variant = TestVariant.option2("one", 2)
+    assert (variant._0, variant._1) == ("one", 2)
+
+
+def test_eq_identity_skips_field_comparison():
+    class NoCompare:
+        def __eq__(self, other):
+            pytest.fail("Fields should not be compared")
+
+    variant = TestVariant.option1(NoCompare())
+    assert variant == variant
+
+
+def test_no_args_set_operations():
+    variants = [TestVariant.option0() for _ in range(3)]
+    assert len(set(variants)) == 1
+    assert TestVariant.option0() in set(variants)
+
+
+def test_value_only_from_own_namespace():
+    class ValueVariant(Variant):
+        exhaust: ()  # type: ignore
+        valued: () = 5  # type: ignore
+
+    assert ValueVariant.valued.__value__ == 5
+    assert not hasattr(ValueVariant.exhaust, "__value__")
+
+
+def test_match_args_shared_between_variants():
+    class Other(Variant):
+        pair: (int, int)  # type: ignore
+
+    assert Other.pair.__match_args__ is TestVariant.option2.__match_args__
+
+
+def test_match_args_large_arity():
+    class Wide(Variant):
+        wide: (int, int, int, int, int, int, int, int, int, int)  # type: ignore
+
+    assert Wide.wide.__match_args__ == tuple(f"_{index}" for index in range(10))
+    match Wide.wide(*range(10)):
+        case Wide.wide(_, _, _, _, _, _, _, _, _, last):
+            assert last == 9
+        case _:
+            pytest.fail("Should be wide")
+
+
+def test_variant_array_round_trip():
+    variants = [
+        TestVariant.option0(),
+        TestVariant.option2("one", 2),
+        TestVariant.option1("two"),
+        TestVariant.option0(),
+    ]
+    array = VariantArray(TestVariant)
+    for variant in variants:
+        array.append(variant)
+
+    assert len(array) == 4
+    assert list(array) == variants
+    assert array[1] == TestVariant.option2("one", 2)
+    assert array[-1] is TestVariant.option0()
+
+
+def test_variant_array_filter_case():
+    array = VariantArray(TestVariant)
+    for variant in (
+        TestVariant.option0(),
+        TestVariant.option1("one"),
+        TestVariant.option0(),
+        TestVariant.option1("two"),
+    ):
+        array.append(variant)
+
+    assert array.filter_case("option0") == [0, 2]
+    assert array.filter_case("option1") == [1, 3]
+    assert array.filter_case("option2") == []
+
+
+def test_variant_array_rejects_other_variants():
+    class Other(Variant):
+        option0: ()  # type: ignore
+
+    array = VariantArray(TestVariant)
+    with pytest.raises(TypeError) as ex:
+        array.append(Other.option0())
+
+    assert "TestVariant" in str(ex.value)
+
+
+def test_hash_is_cached():
+    class CountingHash:
+        calls = 0
+
+        def __hash__(self):
+            CountingHash.calls += 1
+            return 1
+
+    variant = TestVariant.option1(CountingHash())
+    assert hash(variant) == hash(variant)
+    assert CountingHash.calls == 1
+
+
+def test_variant_module():
+    assert TestVariant.option1.__module__ == TestVariant.__module__
+
+
+def test_pickle_does_not_keep_cached_hash():
+    variant = TestVariant.option2("key", 2)
+    hash(variant)
+
+    loaded = pickle.loads(pickle.dumps(variant))
+
+    assert loaded == variant
+    assert not hasattr(loaded, "__variant_hash__")
+    assert loaded in {variant: 1}
+
+
+def test_pickle_no_args_is_singleton():
+    hash(TestVariant.option0())
+    assert pickle.loads(pickle.dumps(TestVariant.option0())) is TestVariant.option0()
+
+
+@pytest.mark.parametrize("name", ["exhaust", "nope"])
+def test_variant_array_filter_case_unknown_name(name):
+    array = VariantArray(TestVariant)
+    with pytest.raises(ValueError) as ex:
+        array.filter_case(name)
+
+    assert name in str(ex.value)
+    assert "TestVariant" in str(ex.value)
+
+
+def test_variant_array_slice():
+    array = VariantArray(TestVariant)
+    for variant in (
+        TestVariant.option0(),
+        TestVariant.option1("one"),
+        TestVariant.option2("two", 2),
+        TestVariant.option0(),
+    ):
+        array.append(variant)
+
+    sliced = array[1:3]
+    assert isinstance(sliced, VariantArray)
+    assert list(sliced) == [TestVariant.option1("one"), TestVariant.option2("two", 2)]
+    assert sliced.filter_case("option0") == []
+    assert list(array[::3]) == [TestVariant.option0(), TestVariant.option0()]
+
+
+@pytest.mark.parametrize(
+    "duplicate",
+    [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_copy_keeps_subclass_slots(duplicate):
+    variant = NotedVariant.plain(1)
+    variant.note = "hello"
+    variant._NotedVariant__private = "secret"
+    hash(variant)
+
+    duplicated = duplicate(variant)
+
+    assert duplicated == variant
+    assert duplicated.note == "hello"
+    assert duplicated._NotedVariant__private == "secret"
+    assert not hasattr(duplicated, "__variant_hash__")
+
+
+def test_variant_named_like_internal_slots():
+    class Internal(Variant):
+        _hash: (int,)  # type: ignore
+        _args: (int,)  # type: ignore
+
+    assert hash(Internal._hash(1)) == hash(Internal._hash(1))
+    assert Internal._args(1) == Internal._args(1)
+
+
+def test_variant_array_inherited_variants():
+    class Child(TestVariant):
+        extra: (int,)  # type: ignore
+
+    array = VariantArray(Child)
+    array.append(Child.option1("one"))
+    array.append(Child.extra(1))
+
+    assert list(array) == [TestVariant.option1("one"), Child.extra(1)]
+    assert array.filter_case("option1") == [0]
+    assert array.filter_case("extra") == [1]